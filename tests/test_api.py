@@ -2,44 +2,80 @@
 Tests for the Mergington High School API
 """
 
+import asyncio
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from src.app import app, activities
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client"""
-    return TestClient(app)
+    """Create a test client shared by the whole test session"""
+    with TestClient(app) as c:
+        yield c
+
+
+# Set when any participant list is mutated through the API
+_dirty = False
+
+
+class _TrackedList(list):
+    """List that flags the module as dirty when appended to or removed from"""
+
+    def append(self, item):
+        global _dirty
+        _dirty = True
+        super().append(item)
+
+    def remove(self, item):
+        global _dirty
+        _dirty = True
+        super().remove(item)
+
+
+for details in activities.values():
+    details["participants"] = _TrackedList(details["participants"])
+
+# Participant lists are mutated and restored in place, so these references
+# stay valid for the whole session
+_PARTICIPANT_REFS = [details["participants"] for details in activities.values()]
+
+
+@pytest.fixture(scope="session")
+def baseline_participants():
+    """Capture the original participants of every activity once per session"""
+    return [tuple(participants) for participants in _PARTICIPANT_REFS]
 
 
 @pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        name: {
-            "description": details["description"],
-            "schedule": details["schedule"],
-            "max_participants": details["max_participants"],
-            "participants": details["participants"].copy()
-        }
-        for name, details in activities.items()
-    }
-    
+def reset_activities(baseline_participants):
+    """Reset activities data after each test"""
+    global _dirty
+    _dirty = False
+
     yield
-    
-    # Restore original state
-    for name, details in original_activities.items():
-        activities[name]["participants"] = details["participants"].copy()
+
+    # Read-only tests leave nothing to restore
+    if not _dirty:
+        return
+
+    # Restore only the activities whose participants changed
+    for participants, original in zip(_PARTICIPANT_REFS, baseline_participants):
+        if tuple(participants) != original:
+            participants[:] = original
 
 
 class TestRootEndpoint:
     """Tests for the root endpoint"""
     
-    def test_root_redirects_to_static(self, client):
+    def test_root_redirects_to_static(self):
         """Test that root redirects to static/index.html"""
-        response = client.get("/", follow_redirects=False)
+        route = next(
+            route for route in app.routes
+            if getattr(route, "path", None) == "/" and "GET" in route.methods
+        )
+        response = route.endpoint()
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -57,20 +93,18 @@ class TestGetActivities:
         assert len(data) > 0
         
         # Check structure of first activity
-        first_activity = list(data.values())[0]
+        first_activity = next(iter(data.values()))
         assert "description" in first_activity
         assert "schedule" in first_activity
         assert "max_participants" in first_activity
         assert "participants" in first_activity
     
-    def test_get_activities_contains_expected_activities(self, client):
+    @pytest.mark.parametrize(
+        "activity_name", ["Chess Club", "Programming Class", "Gym Class"]
+    )
+    def test_get_activities_contains_expected_activities(self, client, activity_name):
         """Test that response contains expected activities"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        assert "Chess Club" in data
-        assert "Programming Class" in data
-        assert "Gym Class" in data
+        assert activity_name in client.get("/activities").json()
 
 
 class TestSignup:
@@ -81,9 +115,8 @@ class TestSignup:
         test_email = "test@mergington.edu"
         activity_name = "Chess Club"
         
-        # Get initial participant count
-        initial_response = client.get("/activities")
-        initial_participants = initial_response.json()[activity_name]["participants"]
+        # Get initial participants
+        initial_participants = list(activities[activity_name]["participants"])
         
         # Sign up
         response = client.post(
@@ -93,8 +126,7 @@ class TestSignup:
         assert response.json()["message"] == f"Signed up {test_email} for {activity_name}"
         
         # Verify participant was added
-        updated_response = client.get("/activities")
-        updated_participants = updated_response.json()[activity_name]["participants"]
+        updated_participants = activities[activity_name]["participants"]
         assert test_email in updated_participants
         assert len(updated_participants) == len(initial_participants) + 1
     
@@ -137,8 +169,7 @@ class TestSignup:
         assert response.status_code == 200
         
         # Verify participant was added
-        updated_response = client.get("/activities")
-        updated_participants = updated_response.json()[activity_name]["participants"]
+        updated_participants = activities[activity_name]["participants"]
         assert test_email in updated_participants
 
 
@@ -154,8 +185,7 @@ class TestUnregister:
         client.post(f"/activities/{activity_name}/signup?email={test_email}")
         
         # Verify signed up
-        response = client.get("/activities")
-        participants_before = response.json()[activity_name]["participants"]
+        participants_before = list(activities[activity_name]["participants"])
         assert test_email in participants_before
         
         # Unregister
@@ -166,8 +196,7 @@ class TestUnregister:
         assert response.json()["message"] == f"Unregistered {test_email} from {activity_name}"
         
         # Verify unregistered
-        response = client.get("/activities")
-        participants_after = response.json()[activity_name]["participants"]
+        participants_after = activities[activity_name]["participants"]
         assert test_email not in participants_after
         assert len(participants_after) == len(participants_before) - 1
     
@@ -196,9 +225,7 @@ class TestUnregister:
         existing_email = "michael@mergington.edu"
         
         # Verify participant exists
-        response = client.get("/activities")
-        participants_before = response.json()[activity_name]["participants"]
-        assert existing_email in participants_before
+        assert existing_email in activities[activity_name]["participants"]
         
         # Unregister
         response = client.delete(
@@ -207,8 +234,7 @@ class TestUnregister:
         assert response.status_code == 200
         
         # Verify removed
-        response = client.get("/activities")
-        participants_after = response.json()[activity_name]["participants"]
+        participants_after = activities[activity_name]["participants"]
         assert existing_email not in participants_after
 
 
@@ -221,9 +247,7 @@ class TestIntegration:
         activity_name = "Swimming Club"
         
         # Get initial state
-        initial_response = client.get("/activities")
-        initial_participants = initial_response.json()[activity_name]["participants"]
-        initial_count = len(initial_participants)
+        initial_count = len(activities[activity_name]["participants"])
         
         # Sign up
         signup_response = client.post(
@@ -232,8 +256,7 @@ class TestIntegration:
         assert signup_response.status_code == 200
         
         # Verify added
-        after_signup = client.get("/activities")
-        after_signup_participants = after_signup.json()[activity_name]["participants"]
+        after_signup_participants = activities[activity_name]["participants"]
         assert len(after_signup_participants) == initial_count + 1
         assert test_email in after_signup_participants
         
@@ -244,23 +267,32 @@ class TestIntegration:
         assert unregister_response.status_code == 200
         
         # Verify removed
-        after_unregister = client.get("/activities")
-        after_unregister_participants = after_unregister.json()[activity_name]["participants"]
+        after_unregister_participants = activities[activity_name]["participants"]
         assert len(after_unregister_participants) == initial_count
         assert test_email not in after_unregister_participants
     
-    def test_multiple_signups_different_activities(self, client):
+    def test_multiple_signups_different_activities(self):
         """Test signing up for multiple activities"""
         test_email = "multi@mergington.edu"
         activities_to_join = ["Chess Club", "Art Studio", "Debate Team"]
         
-        for activity_name in activities_to_join:
-            response = client.post(
-                f"/activities/{activity_name}/signup?email={test_email}"
-            )
-            assert response.status_code == 200
+        # Submit the independent signups concurrently
+        async def signup_all():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://testserver"
+            ) as ac:
+                return await asyncio.gather(*[
+                    ac.post(f"/activities/{activity_name}/signup?email={test_email}")
+                    for activity_name in activities_to_join
+                ])
+        
+        responses = asyncio.run(signup_all())
+        assert all(response.status_code == 200 for response in responses)
         
         # Verify all signups
-        all_activities = client.get("/activities").json()
-        for activity_name in activities_to_join:
-            assert test_email in all_activities[activity_name]["participants"]
+        joined = {
+            name for name, details in activities.items()
+            if test_email in details["participants"]
+        }
+        assert set(activities_to_join) <= joined